@@ -1,7 +1,10 @@
-from fastapi import FastAPI, APIRouter, File, UploadFile, HTTPException
+from fastapi import FastAPI, APIRouter, File, UploadFile, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from bson import ObjectId
+from bson.errors import InvalidId
 import os
 import logging
 from pathlib import Path
@@ -10,6 +13,9 @@ from typing import List, Optional
 import uuid
 from datetime import datetime, timezone, timedelta
 import base64
+import csv
+import json
+import zlib
 from PIL import Image
 import io
 from emergentintegrations.llm.chat import LlmChat, UserMessage, FileContentWithMimeType, ImageContent
@@ -212,7 +218,6 @@ If you cannot extract items clearly, return a sample grocery list with realistic
         response = await chat.send_message(user_message)
         
         # Parse response and add mock comparison prices
-        import json
         import re
         
         # Extract JSON from response
@@ -265,12 +270,20 @@ If you cannot extract items clearly, return a sample grocery list with realistic
         if savings_percent > 10:
             recommendation = f"🎯 Bachat Alert! Save {savings_percent}% (₹{abs(total_savings)}) by smart shopping!"
         
-        return QCommerceResult(
+        result = QCommerceResult(
             items=qcommerce_items,
             total_blinkit=total_blinkit,
             total_savings=abs(total_savings),
             recommendation=recommendation
         )
+        
+        # Persist for bulk export; the Mongo _id doubles as the export resume key
+        await db.qcommerce_analyses.insert_one({
+            **result.model_dump(),
+            "created_at": datetime.now(timezone.utc).isoformat()
+        })
+        
+        return result
     
     except Exception as e:
         logging.error(f"Error analyzing screenshot: {str(e)}")
@@ -324,6 +337,108 @@ async def add_to_shaadi_fund(amount: float):
     
     return {"success": True, "new_total": amount if not current else current.get("total_saved", 0) + amount}
 
+# Exportable collections and the fields each one may project
+EXPORT_COLLECTIONS = {
+    "qcommerce": ("qcommerce_analyses", ["items", "total_blinkit", "total_savings", "recommendation", "created_at"]),
+    "shaadi_fund": ("shaadi_fund", ["user", "total_saved", "transactions", "last_updated"]),
+}
+
+def _export_value(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot export value of type {type(value).__name__}")
+
+def _csv_cell(value):
+    # Nested values (e.g. QCommerce items) are embedded as JSON inside the cell
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=_export_value, ensure_ascii=False)
+    return _export_value(value) if isinstance(value, (ObjectId, datetime)) else value
+
+async def _export_rows(cursor, fields, fmt, batch_size):
+    """Yield encoded chunks of at most ``batch_size`` rows straight off the cursor."""
+    columns = ["_id"] + fields
+    
+    def encode(docs):
+        if fmt == "ndjson":
+            return "".join(
+                json.dumps({col: doc.get(col) for col in columns}, default=_export_value, ensure_ascii=False) + "\n"
+                for doc in docs
+            )
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows([_csv_cell(doc.get(col)) for col in columns] for doc in docs)
+        return buffer.getvalue()
+    
+    if fmt == "csv":
+        header = io.StringIO()
+        csv.writer(header).writerow(columns)
+        yield header.getvalue()
+    
+    batch = []
+    async for doc in cursor:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            yield encode(batch)
+            batch = []
+    if batch:
+        yield encode(batch)
+
+async def _gzip_chunks(chunks):
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+@api_router.get("/export")
+async def export_data(
+    collection: str = Query("qcommerce", pattern="^(qcommerce|shaadi_fund)$"),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    fields: Optional[str] = None,
+    after: Optional[str] = None,
+    batch_size: int = Query(500, ge=1, le=5000),
+    limit: Optional[int] = Query(None, ge=1),
+    gzip: bool = False,
+):
+    collection_name, allowed_fields = EXPORT_COLLECTIONS[collection]
+    
+    if fields:
+        selected = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in selected if f not in allowed_fields]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    else:
+        selected = allowed_fields
+    
+    # Resume strictly after the last _id the client received
+    query = {}
+    if after:
+        try:
+            query["_id"] = {"$gt": ObjectId(after)}
+        except (InvalidId, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid 'after' cursor")
+    
+    cursor = db[collection_name].find(query, {f: 1 for f in selected}).sort("_id", 1).batch_size(batch_size)
+    if limit:
+        cursor = cursor.limit(limit)
+    
+    chunks = _export_rows(cursor, selected, format, batch_size)
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/csv"
+    filename = f"{collection}.{format}"
+    if gzip:
+        chunks = _gzip_chunks(chunks)
+        media_type = "application/gzip"
+        filename += ".gz"
+    
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 app.include_router(api_router)
 
 app.add_middleware(
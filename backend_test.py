@@ -275,6 +275,63 @@ class BaniyaAPITester:
             self.log_test("Shaadi Fund ADD", False, str(e))
             return False
 
+    def test_export_ndjson(self):
+        """Test streaming NDJSON export with projection and resume cursor"""
+        try:
+            response = requests.get(
+                f"{self.api_url}/export",
+                params={"collection": "qcommerce", "fields": "total_savings,created_at", "limit": 2},
+                timeout=15
+            )
+            
+            if response.status_code == 200:
+                rows = [json.loads(line) for line in response.text.splitlines() if line]
+                success = all(set(row.keys()) == {"_id", "total_savings", "created_at"} for row in rows)
+                
+                if success and rows:
+                    # Resuming after the first row must not return it again
+                    resumed = requests.get(
+                        f"{self.api_url}/export",
+                        params={"collection": "qcommerce", "after": rows[0]["_id"], "limit": 1},
+                        timeout=15
+                    )
+                    resumed_rows = [json.loads(line) for line in resumed.text.splitlines() if line]
+                    success = resumed.status_code == 200 and all(r["_id"] != rows[0]["_id"] for r in resumed_rows)
+                
+                self.log_test("Export NDJSON", success, f"Status: {response.status_code}, Rows: {len(rows)}")
+            else:
+                self.log_test("Export NDJSON", False, f"Status: {response.status_code}")
+            
+            return response.status_code == 200
+            
+        except Exception as e:
+            self.log_test("Export NDJSON", False, str(e))
+            return False
+
+    def test_export_csv_gzip(self):
+        """Test gzip-compressed CSV export"""
+        try:
+            response = requests.get(
+                f"{self.api_url}/export",
+                params={"collection": "shaadi_fund", "format": "csv", "gzip": "true"},
+                timeout=15
+            )
+            
+            if response.status_code == 200:
+                import gzip
+                text = gzip.decompress(response.content).decode("utf-8")
+                header = text.splitlines()[0] if text else ""
+                success = header.startswith("_id,user,total_saved")
+                self.log_test("Export CSV gzip", success, f"Status: {response.status_code}, Header: {header}")
+            else:
+                self.log_test("Export CSV gzip", False, f"Status: {response.status_code}")
+            
+            return response.status_code == 200
+            
+        except Exception as e:
+            self.log_test("Export CSV gzip", False, str(e))
+            return False
+
     def run_all_tests(self):
         """Run all backend tests"""
         print("🚀 Starting Baniya.ai Backend API Tests")
@@ -294,6 +351,8 @@ class BaniyaAPITester:
         self.test_sales_predictions_filtered()
         self.test_shaadi_fund_get()
         self.test_shaadi_fund_add()
+        self.test_export_ndjson()
+        self.test_export_csv_gzip()
         
         # Print summary
         print("=" * 60)